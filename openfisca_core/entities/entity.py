@@ -1,7 +1,12 @@
 import os
-import textwrap
 
-from openfisca_core.entities import Role
+from openfisca_core.entities import Role, helpers
+
+VARIABLE_NOT_DEFINED_FOR_ENTITY_MESSAGE = os.linesep.join([
+    "You tried to compute the variable '{0}' for the entity '{1}';",
+    "however the variable '{0}' is defined for '{2}'.",
+    "Learn more about entities in our documentation:",
+    "<https://openfisca.org/doc/coding-the-legislation/50_entities.html>."])
 
 
 class Entity:
@@ -9,14 +14,30 @@ class Entity:
     Represents an entity (e.g. a person, a household, etc.) on which calculations can be run.
     """
 
+    # ``__dict__`` is kept so that country packages can still set their own attributes.
+    __slots__ = ('key', 'label', 'plural', 'doc', 'is_person', '_tax_benefit_system', '__dict__')
+
     def __init__(self, key, plural, label, doc):
         self.key = key
         self.label = label
         self.plural = plural
-        self.doc = textwrap.dedent(doc)
+        self.doc = helpers.dedent(doc)
         self.is_person = True
         self._tax_benefit_system = None
 
+    def __eq__(self, other):
+        # Entities are copied by each tax and benefit system, so they are
+        # compared by key rather than by identity.
+        if not isinstance(other, Entity):
+            return NotImplemented
+        return self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, self.key)
+
     def set_tax_benefit_system(self, tax_benefit_system):
         self._tax_benefit_system = tax_benefit_system
 
@@ -28,13 +49,21 @@ class Entity:
         return self._tax_benefit_system.get_variable(variable_name, check_existence)
 
     def check_variable_defined_for_entity(self, variable_name):
-        variable_entity = self.get_variable(variable_name, check_existence = True).entity
-        # Should be this:
-        # if variable_entity is not self:
+        variable_entity = self._tax_benefit_system.get_variable(variable_name, check_existence = True).entity
         if variable_entity.key != self.key:
-            message = os.linesep.join([
-                "You tried to compute the variable '{0}' for the entity '{1}';".format(variable_name, self.plural),
-                "however the variable '{0}' is defined for '{1}'.".format(variable_name, variable_entity.plural),
-                "Learn more about entities in our documentation:",
-                "<https://openfisca.org/doc/coding-the-legislation/50_entities.html>."])
-            raise ValueError(message)
+            raise ValueError(VARIABLE_NOT_DEFINED_FOR_ENTITY_MESSAGE.format(variable_name, self.plural, variable_entity.plural))
+
+    def check_variables_defined_for_entity(self, variable_names):
+        """
+        Check, in a single pass, that each of the given variables is defined for this entity.
+
+        :param variable_names: Names of the variables to check.
+        :raises VariableNotFoundError: If one of the variables does not exist.
+        :raises ValueError: If one of the variables is defined for another entity.
+        """
+        get_variable = self._tax_benefit_system.get_variable
+        key = self.key
+        for variable_name in variable_names:
+            variable_entity = get_variable(variable_name, check_existence = True).entity
+            if variable_entity.key != key:
+                raise ValueError(VARIABLE_NOT_DEFINED_FOR_ENTITY_MESSAGE.format(variable_name, self.plural, variable_entity.plural))
@@ -6,20 +6,32 @@ class GroupEntity(Entity):
     Represents an entity composed of several persons with different roles, on which calculations are run.
     """
 
+    # Roles are exposed as upper-cased attributes (e.g. ``PARENT``), in the ``__dict__`` inherited from Entity.
+    __slots__ = ('roles_description', 'roles', 'flattened_roles', 'flattened_roles_by_key')
+
     def __init__(self, key, plural, label, doc, roles):
         super().__init__(key, plural, label, doc)
+        # Roles may be given as any iterable, which must only be consumed once.
+        if not isinstance(roles, (list, tuple)):
+            roles = tuple(roles)
         self.roles_description = roles
         self.roles = []
+        self.flattened_roles = []
+        roles_by_attribute = {}
         for role_description in roles:
             role = Role(role_description, self)
-            setattr(self, role.key.upper(), role)
+            roles_by_attribute[role.key.upper()] = role
             self.roles.append(role)
             if role_description.get('subroles'):
                 role.subroles = []
                 for subrole_key in role_description['subroles']:
                     subrole = Role({'key': subrole_key, 'max': 1}, self)
-                    setattr(self, subrole.key.upper(), subrole)
+                    roles_by_attribute[subrole.key.upper()] = subrole
                     role.subroles.append(subrole)
                 role.max = len(role.subroles)
-        self.flattened_roles = sum([role2.subroles or [role2] for role2 in self.roles], [])
+                self.flattened_roles.extend(role.subroles)
+            else:
+                self.flattened_roles.append(role)
+        self.__dict__.update(roles_by_attribute)
+        self.flattened_roles_by_key = {role.key: role for role in self.flattened_roles}
         self.is_person = False
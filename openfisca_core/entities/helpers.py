@@ -1,8 +1,30 @@
+import functools
+import textwrap
+
 from openfisca_core import entities
 
+# Maximum number of docstrings whose dedented version is cached
+DOC_CACHE_SIZE = 128
+
 
 def build_entity(key, plural, label, doc = "", roles = None, is_person = False, class_override = None):
     if is_person:
         return entities.Entity(key, plural, label, doc)
     else:
         return entities.GroupEntity(key, plural, label, doc, roles)
+
+
+@functools.lru_cache(maxsize = DOC_CACHE_SIZE)
+def dedent(doc):
+    """
+    Remove the common leading whitespace of a docstring.
+
+    Entities and roles are often declared with identical, or empty,
+    docstrings, so the result of :func:`textwrap.dedent` is cached.
+
+    >>> dedent("    Persons.")
+    'Persons.'
+    >>> dedent("")
+    ''
+    """
+    return textwrap.dedent(doc)
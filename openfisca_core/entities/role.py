@@ -1,14 +1,17 @@
-import textwrap
+from openfisca_core.entities import helpers
 
 
 class Role:
 
+    # ``__dict__`` is kept so that country packages can still set their own attributes.
+    __slots__ = ('entity', 'key', 'label', 'plural', 'doc', 'max', 'subroles', '__dict__')
+
     def __init__(self, description, entity):
         self.entity = entity
         self.key = description['key']
         self.label = description.get('label')
         self.plural = description.get('plural')
-        self.doc = textwrap.dedent(description.get('doc', ""))
+        self.doc = helpers.dedent(description.get('doc', ""))
         self.max = description.get('max')
         self.subroles = None
 
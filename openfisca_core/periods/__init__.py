@@ -26,7 +26,10 @@ from .config import (  # noqa: F401
     MONTH,
     YEAR,
     ETERNITY,
+    FINITE_UNITS,
+    UNIT_WEIGHTS,
     INSTANT_PATTERN,
+    ISO_FORMAT_PATTERN,
     date_by_instant_cache,
     str_by_instant_cache,
     year_or_month_or_day_re,
@@ -38,6 +41,7 @@ from .helpers import (  # noqa: F401
     instant_date,
     period,
     key_period_size,
+    last_day_of_month,
     unit_weights,
     unit_weight,
     )
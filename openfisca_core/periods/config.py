@@ -6,10 +6,37 @@ MONTH = 'month'
 YEAR = 'year'
 ETERNITY = 'eternity'
 
+# Units of the periods that have a finite size
+FINITE_UNITS = (DAY, MONTH, YEAR)
+
+# Used to sort periods by length
+UNIT_WEIGHTS = {
+    DAY: 100,
+    MONTH: 200,
+    YEAR: 300,
+    ETERNITY: 400,
+    }
+
+# Number of days of each month in a common year, indexed from 1
+DAYS_BY_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 # Matches "2015", "2015-01", "2015-01-01"
 # Does not match "2015-13", "2015-12-32"
 INSTANT_PATTERN = re.compile(r"^\d{4}(-(0[1-9]|1[012]))?(-(0[1-9]|1[012])-(0[1-9]|[12][0-9]|3[01]))?$")
 
+# Matches "2015", "2015-1", "2015-01", "2015-1-1", "2015-01-01", "2015-01- 1"
+# Captures the year, and the month and day when present
+# Accepts the same months and days as strptime's %m and %d
+ISO_FORMAT_PATTERN = re.compile(r"^(\d{4})(?:-(1[0-2]|0[1-9]|[1-9])(?:-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9]))?)?$")
+
+# Maximum number of instant and period strings whose parsing is cached,
+# as the same strings are parsed over and over during a simulation
+PARSE_CACHE_SIZE = 4096
+
+# Maximum number of instants whose date and string representation are cached
+INSTANT_CACHE_SIZE = 8192
+
+# Instant dates and strings, cleared once they hold INSTANT_CACHE_SIZE instants
 date_by_instant_cache: typing.Dict = {}
 str_by_instant_cache: typing.Dict = {}
 year_or_month_or_day_re = re.compile(r'(18|19|20)\d{2}(-(0?[1-9]|1[0-2])(-([0-2]?\d|3[0-1]))?)?$')
@@ -1,9 +1,17 @@
+import calendar
 import datetime
+import functools
 import os
 
 from openfisca_core import periods
 from openfisca_core.periods import config
 
+INVALID_PERIOD_MESSAGE = os.linesep.join([
+    "Expected a period (eg. '2017', '2017-01', '2017-01-01', ...); got: '{}'.",
+    "Learn more about legal period formats in OpenFisca:",
+    "<https://openfisca.org/doc/coding-the-legislation/35_periods.html#periods-in-simulations>."
+    ])
+
 
 def N_(message):
     return message
@@ -32,24 +40,33 @@ def instant(instant):
     if isinstance(instant, periods.Instant):
         return instant
     if isinstance(instant, str):
-        if not config.INSTANT_PATTERN.match(instant):
-            raise ValueError("'{}' is not a valid instant. Instants are described using the 'YYYY-MM-DD' format, for instance '2015-06-15'.".format(instant))
-        instant = periods.Instant(
-            int(fragment)
-            for fragment in instant.split('-', 2)[:3]
-            )
-    elif isinstance(instant, datetime.date):
-        instant = periods.Instant((instant.year, instant.month, instant.day))
-    elif isinstance(instant, int):
-        instant = (instant,)
-    elif isinstance(instant, list):
-        assert 1 <= len(instant) <= 3
-        instant = tuple(instant)
-    elif isinstance(instant, periods.Period):
-        instant = instant.start
-    else:
-        assert isinstance(instant, tuple), instant
-        assert 1 <= len(instant) <= 3
+        return _parse_instant(instant)
+    if isinstance(instant, periods.Period):
+        return instant.start
+    if isinstance(instant, datetime.date):
+        return periods.Instant((instant.year, instant.month, instant.day))
+    if isinstance(instant, int):
+        return periods.Instant((instant, 1, 1))
+    assert isinstance(instant, (list, tuple)), instant
+    assert 1 <= len(instant) <= 3
+    if len(instant) == 1:
+        return periods.Instant((instant[0], 1, 1))
+    if len(instant) == 2:
+        return periods.Instant((instant[0], instant[1], 1))
+    return periods.Instant(instant)
+
+
+@functools.lru_cache(maxsize = config.PARSE_CACHE_SIZE)
+def _parse_instant(value):
+    """
+    Parses instants respecting the ISO format, such as 2015 or 2015-06-15.
+    """
+    if not config.INSTANT_PATTERN.match(value):
+        raise ValueError("'{}' is not a valid instant. Instants are described using the 'YYYY-MM-DD' format, for instance '2015-06-15'.".format(value))
+    instant = tuple(
+        int(fragment)
+        for fragment in value.split('-', 2)[:3]
+        )
     if len(instant) == 1:
         return periods.Instant((instant[0], 1, 1))
     if len(instant) == 2:
@@ -62,6 +79,8 @@ def instant_date(instant):
         return None
     instant_date = config.date_by_instant_cache.get(instant)
     if instant_date is None:
+        if len(config.date_by_instant_cache) >= config.INSTANT_CACHE_SIZE:
+            config.date_by_instant_cache.clear()
         config.date_by_instant_cache[instant] = instant_date = datetime.date(*instant)
     return instant_date
 
@@ -87,88 +106,115 @@ def period(value):
     if isinstance(value, periods.Period):
         return value
 
+    # years are the most common non-string periods, so they are checked first
+    if isinstance(value, int):
+        return periods.Period((config.YEAR, periods.Instant((value, 1, 1)), 1))
+
     if isinstance(value, periods.Instant):
         return periods.Period((config.DAY, value, 1))
 
-    def parse_simple_period(value):
-        """
-        Parses simple periods respecting the ISO format, such as 2012 or 2015-03
-        """
-        try:
-            date = datetime.datetime.strptime(value, '%Y')
-        except ValueError:
-            try:
-                date = datetime.datetime.strptime(value, '%Y-%m')
-            except ValueError:
-                try:
-                    date = datetime.datetime.strptime(value, '%Y-%m-%d')
-                except ValueError:
-                    return None
-                else:
-                    return periods.Period((config.DAY, periods.Instant((date.year, date.month, date.day)), 1))
-            else:
-                return periods.Period((config.MONTH, periods.Instant((date.year, date.month, 1)), 1))
-        else:
-            return periods.Period((config.YEAR, periods.Instant((date.year, date.month, 1)), 1))
-
-    def raise_error(value):
-        message = os.linesep.join([
-            "Expected a period (eg. '2017', '2017-01', '2017-01-01', ...); got: '{}'.".format(value),
-            "Learn more about legal period formats in OpenFisca:",
-            "<https://openfisca.org/doc/coding-the-legislation/35_periods.html#periods-in-simulations>."
-            ])
-        raise ValueError(message)
+    # check the type
+    if not isinstance(value, str):
+        _raise_period_error(value)
+
+    return _parse_period(value)
+
+
+@functools.lru_cache(maxsize = config.PARSE_CACHE_SIZE)
+def _parse_period(value):
+    """
+    Parses periods from their string representation, such as 2015, 2015-03 or month:2015-03:3.
 
+    Periods are immutable, so the parsed periods can be cached and shared.
+    """
     if value == 'ETERNITY' or value == config.ETERNITY:
         return periods.Period(('eternity', instant(datetime.date.min), float("inf")))
 
-    # check the type
-    if isinstance(value, int):
-        return periods.Period((config.YEAR, periods.Instant((value, 1, 1)), 1))
-    if not isinstance(value, str):
-        raise_error(value)
-
     # try to parse as a simple period
-    period = parse_simple_period(value)
+    period = _parse_simple_period(value)
     if period is not None:
         return period
 
     # complex period must have a ':' in their strings
     if ":" not in value:
-        raise_error(value)
+        _raise_period_error(value)
 
-    components = value.split(':')
+    # at most 3 components are valid, no need to split any further
+    components = value.split(':', 2)
 
     # left-most component must be a valid unit
     unit = components[0]
-    if unit not in (config.DAY, config.MONTH, config.YEAR):
-        raise_error(value)
+    if unit not in config.FINITE_UNITS:
+        _raise_period_error(value)
 
     # middle component must be a valid iso period
-    base_period = parse_simple_period(components[1])
+    base_period = _parse_simple_period(components[1])
     if not base_period:
-        raise_error(value)
+        _raise_period_error(value)
 
     # period like year:2015-03 have a size of 1
     if len(components) == 2:
         size = 1
     # if provided, make sure the size is an integer
-    elif len(components) == 3:
+    # if there is more than 2 ":" in the string, the size is not an integer
+    else:
         try:
             size = int(components[2])
         except ValueError:
-            raise_error(value)
-    # if there is more than 2 ":" in the string, the period is invalid
-    else:
-        raise_error(value)
+            _raise_period_error(value)
 
     # reject ambiguous period such as month:2014
     if unit_weight(base_period.unit) > unit_weight(unit):
-        raise_error(value)
+        _raise_period_error(value)
 
     return periods.Period((unit, base_period.start, size))
 
 
+def _parse_simple_period(value):
+    """
+    Parses simple periods respecting the ISO format, such as 2012 or 2015-03
+    """
+    match = config.ISO_FORMAT_PATTERN.fullmatch(value)
+    if match is None:
+        return None
+    year, month, day = match.groups()
+    try:
+        date = datetime.date(int(year), int(month or 1), int(day or 1))
+    except ValueError:
+        return None
+    if day is not None:
+        return periods.Period((config.DAY, periods.Instant((date.year, date.month, date.day)), 1))
+    if month is not None:
+        return periods.Period((config.MONTH, periods.Instant((date.year, date.month, 1)), 1))
+    return periods.Period((config.YEAR, periods.Instant((date.year, date.month, 1)), 1))
+
+
+def _raise_period_error(value):
+    raise ValueError(INVALID_PERIOD_MESSAGE.format(value))
+
+
+def last_day_of_month(year, month):
+    """
+    Return the last day of the given month.
+
+    Unlike :func:`calendar.monthrange`, does not compute the weekday of
+    the first day of the month, as only the number of days is needed. Like
+    it, raises :class:`calendar.IllegalMonthError` for months outside 1-12.
+
+    >>> last_day_of_month(2014, 2)
+    28
+    >>> last_day_of_month(2012, 2)
+    29
+    >>> last_day_of_month(2014, 12)
+    31
+    """
+    if not 1 <= month <= 12:
+        raise calendar.IllegalMonthError(month)
+    if month == 2 and calendar.isleap(year):
+        return 29
+    return config.DAYS_BY_MONTH[month]
+
+
 def key_period_size(period):
     """
     Defines a key in order to sort periods by length. It uses two aspects : first unit then size
@@ -187,17 +233,12 @@ def key_period_size(period):
 
     unit, start, size = period
 
-    return '{}_{}'.format(unit_weight(unit), size)
+    return '{}_{}'.format(config.UNIT_WEIGHTS[unit], size)
 
 
 def unit_weights():
-    return {
-        config.DAY: 100,
-        config.MONTH: 200,
-        config.YEAR: 300,
-        config.ETERNITY: 400,
-        }
+    return config.UNIT_WEIGHTS.copy()
 
 
 def unit_weight(unit):
-    return unit_weights()[unit]
+    return config.UNIT_WEIGHTS[unit]
@@ -2,11 +2,13 @@ import calendar
 import datetime
 
 from openfisca_core import periods
-from openfisca_core.periods import config
+from openfisca_core.periods import config, helpers
 
 
 class Instant(tuple):
 
+    __slots__ = ()
+
     def __repr__(self):
         """
         Transform instant to to its Python representation as a string.
@@ -34,6 +36,8 @@ class Instant(tuple):
         """
         instant_str = config.str_by_instant_cache.get(self)
         if instant_str is None:
+            if len(config.str_by_instant_cache) >= config.INSTANT_CACHE_SIZE:
+                config.str_by_instant_cache.clear()
             config.str_by_instant_cache[self] = instant_str = self.date.isoformat()
         return instant_str
 
@@ -49,10 +53,7 @@ class Instant(tuple):
         >>> instant('2014-2-3').date
         datetime.date(2014, 2, 3)
         """
-        instant_date = config.date_by_instant_cache.get(self)
-        if instant_date is None:
-            config.date_by_instant_cache[self] = instant_date = datetime.date(*self)
-        return instant_date
+        return helpers.instant_date(self)
 
     @property
     def day(self):
@@ -93,7 +94,7 @@ class Instant(tuple):
         >>> instant('2014-2-3').period('day', size = 2)
         Period(('day', Instant((2014, 2, 3)), 2))
         """
-        assert unit in (config.DAY, config.MONTH, config.YEAR), 'Invalid unit: {} of type {}'.format(unit, type(unit))
+        assert unit in config.FINITE_UNITS, 'Invalid unit: {} of type {}'.format(unit, type(unit))
         assert isinstance(size, int) and size >= 1, 'Invalid size: {} of type {}'.format(size, type(size))
         return periods.Period((unit, self, size))
 
@@ -179,7 +180,7 @@ class Instant(tuple):
         Instant((2014, 12, 31))
         """
         year, month, day = self
-        assert unit in (config.DAY, config.MONTH, config.YEAR), 'Invalid unit: {} of type {}'.format(unit, type(unit))
+        assert unit in config.FINITE_UNITS, 'Invalid unit: {} of type {}'.format(unit, type(unit))
         if offset == 'first-of':
             if unit == config.MONTH:
                 day = 1
@@ -188,47 +189,38 @@ class Instant(tuple):
                 day = 1
         elif offset == 'last-of':
             if unit == config.MONTH:
-                day = calendar.monthrange(year, month)[1]
+                day = helpers.last_day_of_month(year, month)
             elif unit == config.YEAR:
                 month = 12
                 day = 31
         else:
             assert isinstance(offset, int), 'Invalid offset: {} of type {}'.format(offset, type(offset))
             if unit == config.DAY:
-                day += offset
-                if offset < 0:
-                    while day < 1:
-                        month -= 1
-                        if month == 0:
-                            year -= 1
-                            month = 12
-                        day += calendar.monthrange(year, month)[1]
-                elif offset > 0:
-                    month_last_day = calendar.monthrange(year, month)[1]
-                    while day > month_last_day:
-                        month += 1
-                        if month == 13:
-                            year += 1
-                            month = 1
-                        day -= month_last_day
-                        month_last_day = calendar.monthrange(year, month)[1]
+                # Walking month by month is faster than going through
+                # ordinals for offsets of up to about three months.
+                if -92 <= offset <= 92:
+                    year, month, day = _offset_days(year, month, day, offset)
+                else:
+                    try:
+                        date = datetime.date.fromordinal(self.date.toordinal() + offset)
+                        year, month, day = date.year, date.month, date.day
+                    except (OverflowError, ValueError):
+                        # Out of datetime's range, or not a valid date.
+                        year, month, day = _offset_days(year, month, day, offset)
             elif unit == config.MONTH:
-                month += offset
-                if offset < 0:
-                    while month < 1:
-                        year -= 1
-                        month += 12
-                elif offset > 0:
-                    while month > 12:
-                        year += 1
-                        month -= 12
-                month_last_day = calendar.monthrange(year, month)[1]
+                # divmod would silently fix an invalid month up.
+                if not 1 <= month <= 12:
+                    raise calendar.IllegalMonthError(month)
+                years, month = divmod(month - 1 + offset, 12)
+                year += years
+                month += 1
+                month_last_day = helpers.last_day_of_month(year, month)
                 if day > month_last_day:
                     day = month_last_day
             elif unit == config.YEAR:
                 year += offset
                 # Handle february month of leap year.
-                month_last_day = calendar.monthrange(year, month)[1]
+                month_last_day = helpers.last_day_of_month(year, month)
                 if day > month_last_day:
                     day = month_last_day
 
@@ -247,3 +239,27 @@ class Instant(tuple):
         2014
         """
         return self[0]
+
+
+def _offset_days(year, month, day, offset):
+    """
+    Increment (or decrement) the given date with offset days, month by month.
+    """
+    day += offset
+    if offset < 0:
+        while day < 1:
+            month -= 1
+            if month == 0:
+                year -= 1
+                month = 12
+            day += helpers.last_day_of_month(year, month)
+    elif offset > 0:
+        month_last_day = helpers.last_day_of_month(year, month)
+        while day > month_last_day:
+            month += 1
+            if month == 13:
+                year += 1
+                month = 1
+            day -= month_last_day
+            month_last_day = helpers.last_day_of_month(year, month)
+    return year, month, day
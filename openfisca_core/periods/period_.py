@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import calendar
-
 from openfisca_core import periods
 from openfisca_core.periods import config, helpers
 
@@ -16,6 +14,8 @@ class Period(tuple):
     Since a period is a triple it can be used as a dictionary key.
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         """
         Transform period to to its Python representation as a string.
@@ -140,8 +140,7 @@ class Period(tuple):
                 intersection_start,
                 intersection_stop.year - intersection_start.year + 1,
                 ))
-        if intersection_start.day == 1 and intersection_stop.day == calendar.monthrange(intersection_stop.year,
-                intersection_stop.month)[1]:
+        if intersection_start.day == 1 and intersection_stop.day == helpers.last_day_of_month(intersection_stop.year, intersection_stop.month):
             return self.__class__((
                 'month',
                 intersection_start,
@@ -414,20 +413,19 @@ class Period(tuple):
         if unit == 'day':
             if size > 1:
                 day += size - 1
-                month_last_day = calendar.monthrange(year, month)[1]
+                month_last_day = helpers.last_day_of_month(year, month)
                 while day > month_last_day:
                     month += 1
                     if month == 13:
                         year += 1
                         month = 1
                     day -= month_last_day
-                    month_last_day = calendar.monthrange(year, month)[1]
+                    month_last_day = helpers.last_day_of_month(year, month)
         else:
             if unit == 'month':
-                month += size
-                while month > 12:
-                    year += 1
-                    month -= 12
+                years, month = divmod(month - 1 + size, 12)
+                year += years
+                month += 1
             else:
                 assert unit == 'year', 'Invalid unit: {} of type {}'.format(unit, type(unit))
                 year += size
@@ -437,9 +435,9 @@ class Period(tuple):
                 if month == 0:
                     year -= 1
                     month = 12
-                day += calendar.monthrange(year, month)[1]
+                day += helpers.last_day_of_month(year, month)
             else:
-                month_last_day = calendar.monthrange(year, month)[1]
+                month_last_day = helpers.last_day_of_month(year, month)
                 if day > month_last_day:
                     month += 1
                     if month == 13:
@@ -79,7 +79,7 @@ class GroupPopulation(Population):
         return self._ordered_members_map
 
     def get_role(self, role_name):
-        return next((role for role in self.entity.flattened_roles if role.key == role_name), None)
+        return self.entity.flattened_roles_by_key.get(role_name)
 
     #  Aggregation persons -> entity
 
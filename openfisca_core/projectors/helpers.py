@@ -18,6 +18,6 @@ def get_projector_from_shortcut(population, shortcut, parent = None):
     else:
         if shortcut == 'first_person':
             return projectors.FirstPersonToEntityProjector(population, parent)
-        role = next((role for role in population.entity.flattened_roles if (role.max == 1) and (role.key == shortcut)), None)
-        if role:
+        role = population.entity.flattened_roles_by_key.get(shortcut)
+        if role is not None and role.max == 1:
             return projectors.UniqueRoleToEntityProjector(population, role, parent)
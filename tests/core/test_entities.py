@@ -1,8 +1,12 @@
 from copy import deepcopy
 
+import pytest
+
 from openfisca_country_template import entities, situation_examples
 
 from openfisca_core import tools
+from openfisca_core.entities import GroupEntity
+from openfisca_core.errors import VariableNotFoundError
 from openfisca_core.simulations import SimulationBuilder
 from openfisca_core.tools import test_runner
 
@@ -493,3 +497,51 @@ def test_unordered_persons(tax_benefit_system):
     tools.assert_near(household.project(accommodation_size), [60, 160, 160, 160, 60, 160])
     tools.assert_near(household.project(accommodation_size, role = PARENT), [60, 0, 160, 0, 0, 160])
     tools.assert_near(household.project(accommodation_size, role = CHILD), [0, 160, 0, 160, 60, 0])
+
+
+def test_entities_are_compared_by_key(tax_benefit_system):
+    person = tax_benefit_system.person_entity
+    household = tax_benefit_system.get_variable('rent').entity
+
+    assert person == entities.Person
+    assert hash(person) == hash(entities.Person)
+    assert household == entities.Household
+    assert person != household
+
+
+def test_check_variables_defined_for_entity(tax_benefit_system):
+    tax_benefit_system.person_entity.check_variables_defined_for_entity(['salary', 'age'])
+
+    with pytest.raises(ValueError, match = "'rent' is defined for 'households'"):
+        tax_benefit_system.person_entity.check_variables_defined_for_entity(['salary', 'rent'])
+
+    with pytest.raises(VariableNotFoundError):
+        tax_benefit_system.person_entity.check_variables_defined_for_entity(['salary', 'unknown_variable'])
+
+
+def test_entity_repr(tax_benefit_system):
+    assert repr(tax_benefit_system.person_entity) == "Entity(person)"
+    assert repr(tax_benefit_system.get_variable('rent').entity) == "GroupEntity(household)"
+
+
+def test_entities_accept_custom_attributes():
+    household = GroupEntity("household", "households", "", "", [{'key': 'parent'}])
+    household.custom_attribute = "custom"
+    household.PARENT.custom_attribute = "custom"
+    assert household.custom_attribute == household.PARENT.custom_attribute == "custom"
+
+
+def test_group_entity_with_roles_generator():
+    roles = ({'key': key} for key in ('parent', 'child'))
+    household = GroupEntity("household", "households", "", "", roles)
+
+    assert household.roles_description == ({'key': 'parent'}, {'key': 'child'})
+    assert household.flattened_roles == [household.PARENT, household.CHILD]
+
+
+def test_get_role(tax_benefit_system):
+    simulation = new_simulation(tax_benefit_system, TEST_CASE)
+
+    assert simulation.household.get_role('first_parent') == FIRST_PARENT
+    assert simulation.household.get_role('child') == CHILD
+    assert simulation.household.get_role('parent') is None
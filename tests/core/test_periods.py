@@ -3,7 +3,7 @@
 
 import pytest
 
-from openfisca_core.periods import Period, Instant, YEAR, MONTH, DAY, period
+from openfisca_core.periods import Period, Instant, YEAR, MONTH, DAY, config, last_day_of_month, period
 
 first_jan = Instant((2014, 1, 1))
 first_march = Instant((2014, 3, 1))
@@ -110,6 +110,16 @@ def test_wrong_syntax_several_days():
         period('2014-2-3:2')
 
 
+def test_parsing_space_padded_day():
+    assert period('2014-01- 1') == Period((DAY, first_jan, 1))
+    assert period('day:2014-03- 1:3') == Period((DAY, first_march, 3))
+
+
+def test_wrong_space_padded_month():
+    with pytest.raises(ValueError):
+        period('2014- 1')
+
+
 def test_day_size_in_days():
     assert Period(('day', Instant((2014, 12, 31)), 1)).size_in_days == 1
 
@@ -201,3 +211,52 @@ def test_subperiods(test):
         assert subperiods[-1] == last
 
         check_subperiods(*test)
+
+
+@pytest.mark.parametrize("year, month, last_day", [
+    (2014, 1, 31),
+    (2014, 2, 28),
+    (2012, 2, 29),
+    (2000, 2, 29),
+    (1900, 2, 28),
+    (2014, 4, 30),
+    (2014, 12, 31),
+    ])
+def test_last_day_of_month(year, month, last_day):
+    assert last_day_of_month(year, month) == last_day
+
+
+@pytest.mark.parametrize("month", [0, -1, -2, 13])
+def test_last_day_of_invalid_month(month):
+    with pytest.raises(ValueError):
+        last_day_of_month(2014, month)
+    with pytest.raises(ValueError):
+        Instant((2014, month, 15)).offset('last-of', 'month')
+    with pytest.raises(ValueError):
+        Instant((2014, month, 15)).offset(0, 'month')
+
+
+def test_instant_caches_are_bounded(monkeypatch):
+    monkeypatch.setattr(config, "INSTANT_CACHE_SIZE", 2)
+    monkeypatch.setattr(config, "date_by_instant_cache", {})
+    monkeypatch.setattr(config, "str_by_instant_cache", {})
+    for day in range(1, 6):
+        instant = Instant((2014, 1, day))
+        assert str(instant) == "2014-01-0{}".format(day)
+    assert len(config.date_by_instant_cache) <= 2
+    assert len(config.str_by_instant_cache) <= 2
+
+
+@pytest.mark.parametrize("start, offset, expected", [
+    ((2014, 2, 3), 1, (2014, 2, 4)),
+    ((2014, 2, 3), 365, (2015, 2, 3)),
+    ((2014, 2, 3), -365, (2013, 2, 3)),
+    ((9999, 12, 31), 1, (10000, 1, 1)),
+    ((9999, 12, 31), 366, (10000, 12, 31)),
+    ((1, 1, 1), -1, (0, 12, 31)),
+    ((1, 1, 1), -365, (0, 1, 2)),
+    ((2015, 2, 30), 1, (2015, 3, 3)),
+    ((2015, 2, 30), 100, (2015, 6, 10)),
+    ])
+def test_offset_days(start, offset, expected):
+    assert Instant(start).offset(offset, DAY) == Instant(expected)
@@ -25,12 +25,12 @@ class TestGroupEntity(GroupEntity):
         return True
 
 
-@pytest.fixture
+@pytest.fixture(scope = "module")
 def persons():
     return TestEntity("person", "persons", "", "")
 
 
-@pytest.fixture
+@pytest.fixture(scope = "module")
 def households():
     roles = [{
         'key': 'parent',
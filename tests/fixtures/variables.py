@@ -7,5 +7,9 @@ class TestVariable(Variable):
     value_type = float
 
     def __init__(self, entity):
-        self.__class__.entity = entity
+        # Variable reads its entity from the class, but setting a class
+        # attribute invalidates the type's attribute cache: only do it when
+        # the entity actually changes.
+        if self.__class__.__dict__.get("entity") is not entity:
+            self.__class__.entity = entity
         super().__init__()